@@ -28,11 +28,10 @@ class _Button(Button):
     """
 
     def __init__(self, root: tk.Tk, text: str, button_command: Callable):
-        """Create a generic button of a fixed size and white background.
+        """Create a generic button. Its padding and white background come
+        from the defaults root adds to the Tk option database.
         """
-        Button.__init__(self, root, text=text, padx=10, pady=5,
-                        command=button_command,
-                        bg='white')
+        Button.__init__(self, root, text=text, command=button_command)
 
     def disable_button(self) -> None:
         """Disable the button widget.
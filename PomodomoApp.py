@@ -14,43 +14,31 @@
 
 # Imports
 from __future__ import annotations
+import math
+import time
 import tkinter as tk
-from tkinter import *
+from tkinter import Label
+import tkinter.font as tkfont
 import tkinter.messagebox
 
 from Buttons import _Button
 from Timers import _Timer
-from InputBoxes import _WorkTimeInput, _BreakTimeInput
+from InputBoxes import _TimeInput
 
 INVALID_INPUT_ERROR = 'Please enter a whole number of minutes as work/break time.'
 
+# Work and break times (in minutes) the app starts up with
+DEFAULT_WORK_MINUTES = 25
+DEFAULT_BREAK_MINUTES = 5
 
-def _is_valid_time(s: str) -> bool:
-    """Returns whether a user-inputted time is a valid integer number of
-    minutes, that is greater than zero.
+# Which timer is counting down in a Pomodoro cycle, as an index into
+# PomodomoApp._timers
+_WORK_PHASE = 0
+_BREAK_PHASE = 1
 
-    Credit to https://note.nkmk.me/en/python-check-int-float/ for this
-    function code
-
-    >>> _is_valid_time('ooooo')
-    False
-    >>> _is_valid_time('90')
-    True
-    >>> _is_valid_time('29.20023')
-    False
-    >>> _is_valid_time('0')
-    False
-    >>> _is_valid_time('-23.4')
-    False
-    """
-    try:
-        tmp = float(s)
-
-    except ValueError:
-        return False  # s wasn't an int, or float coercible to int
-
-    else:  # check if float is coercible to int
-        return tmp.is_integer() and tmp > 0
+# How long (in milliseconds) the start/pause button is disabled for after
+# being pressed, so rapid clicks can't pile up conflicting state changes
+BUTTON_LOCKOUT_MS = 150
 
 
 class PomodomoApp(tk.Tk):
@@ -70,17 +58,33 @@ class PomodomoApp(tk.Tk):
         self.minsize(425, 275)
         self.config(bg='white')  # make window background white
 
+        # Set the default look of every button and label in the window once,
+        # instead of passing the same options to each widget
+        self.option_add('*Button.background', 'white')
+        self.option_add('*Button.padX', 10)
+        self.option_add('*Button.padY', 5)
+        self.option_add('*Label.background', 'white')
+
+        # Create the fonts for the timers and input fields once, so widgets
+        # of the same kind share a single Tk font
+        self._timer_font = tkfont.Font(self, family='Arial', size=48)
+        self._input_font = tkfont.Font(self, family='Arial')
+
         # Create a work timer and break timer object
-        self.work_timer = _Timer(self)
-        self.break_timer = _Timer(self)
+        self.work_timer = _Timer(self, DEFAULT_WORK_MINUTES, self._timer_font)
+        self.break_timer = _Timer(self, DEFAULT_BREAK_MINUTES,
+                                  self._timer_font)
+
+        # The timers indexed by phase, so the loop can look up which timer
+        # is counting down instead of branching on it
+        self._timers = (self.work_timer, self.break_timer)
 
         # Create input fields for user to specify work time and break time
         # Default text in input fields is default work/break times
-        self.work_time_input = _WorkTimeInput(self)
-        self.break_time_input = _BreakTimeInput(self)
-
-        self.work_timer.set_time(self.work_time_input.get_user_input())
-        self.break_timer.set_time(self.break_time_input.get_user_input())
+        self.work_time_input = _TimeInput(self, DEFAULT_WORK_MINUTES,
+                                          self._input_font)
+        self.break_time_input = _TimeInput(self, DEFAULT_BREAK_MINUTES,
+                                           self._input_font)
 
         # Create buttons to start/pause the app, and to reset the timers and
         # stop the app
@@ -99,32 +103,48 @@ class PomodomoApp(tk.Tk):
         self.started = False
         self.paused = False
 
+        # time.monotonic() time at which the currently counting down timer
+        # will hit zero, set whenever the countdown is started or unpaused
+        self._tick_deadline = None
+
+        # Whether the work timer (_WORK_PHASE) or break timer (_BREAK_PHASE)
+        # is the one counting down
+        self._phase = _WORK_PHASE
+
+        # Tkinter after() id of the next scheduled _pomodomo_countdown_loop
+        # call, or None if the countdown loop isn't scheduled
+        self._loop_id = None
+
         # add labels to on-screen elements, get rid of this later...
-        self.work_timer_label = Label(self, text='WORK', bg='white')
-        self.break_timer_label = Label(self, text='BREAK', bg='white')
-        self.work_input_label = Label(self,
-                                      text='Enter work time (minutes):',
-                                      bg='white')
+        self.work_timer_label = Label(self, text='WORK')
+        self.break_timer_label = Label(self, text='BREAK')
+        self.work_input_label = Label(self, text='Enter work time (minutes):')
         self.break_input_label = Label(self,
-                                       text='Enter break time (minutes):',
-                                       bg='white')
+                                       text='Enter break time (minutes):')
 
         # Pack all the widgets onto the screen
-        self.work_timer.grid(row=0, column=1)
-        self.work_timer_label.grid(row=0, column=0)
-        self.break_timer.grid(row=1, column=1)
-        self.break_timer_label.grid(row=1, column=0)
-        self.work_time_input.grid(row=2, column=1)
-        self.work_input_label.grid(row=2, column=0)
-        self.break_time_input.grid(row=3, column=1)
-        self.break_input_label.grid(row=3, column=0)
-        self.start_and_pause_button.grid(row=4, column=1)
-        self.reset_button.grid(row=5, column=1)
+        for widget, row, column in [
+                (self.work_timer, 0, 1),
+                (self.work_timer_label, 0, 0),
+                (self.break_timer, 1, 1),
+                (self.break_timer_label, 1, 0),
+                (self.work_time_input, 2, 1),
+                (self.work_input_label, 2, 0),
+                (self.break_time_input, 3, 1),
+                (self.break_input_label, 3, 0),
+                (self.start_and_pause_button, 4, 1),
+                (self.reset_button, 5, 1)]:
+            widget.grid(row=row, column=column)
 
     def start_or_pause_pomodomo_session(self) -> None:
         """Starts or pauses the countdown of the work and break timers,
         when the 'Start / Pause' button is pressed.
         """
+        # Briefly disable the button so rapid clicks can't pile up
+        self.start_and_pause_button.disable_button()
+        self.after(BUTTON_LOCKOUT_MS,
+                   self.start_and_pause_button.enable_button)
+
         if not self.started:
             # Set user inputted times into work and break timers
             input_work = self.work_time_input.get_user_input()
@@ -135,12 +155,13 @@ class PomodomoApp(tk.Tk):
 
             if work_timer_setup and break_timer_setup:
                 self.started = True
+                self._phase = _WORK_PHASE
+                self._tick_deadline = \
+                    time.monotonic() + self.work_timer.seconds_left
 
                 # start countdown loop, after a 1 second delay to prevent the
                 # first second from counting down immediately
-                self.start_and_pause_button.disable_button()
-                self.after(1000, self._pomodomo_countdown_loop)
-                self.after(1000, self.start_and_pause_button.enable_button)
+                self._loop_id = self.after(1000, self._pomodomo_countdown_loop)
 
                 # disable the entry boxes for work and break time when the
                 # pomodomo app has started
@@ -158,12 +179,14 @@ class PomodomoApp(tk.Tk):
         # execution of the pomodomo countdown loop
         elif not self.paused:
             self.paused = True
-            self.start_and_pause_button.disable_button()
-            self.after(1000, self.start_and_pause_button.enable_button)
+            self._cancel_countdown_loop()
 
         else:  # App had started, and was paused
             self.paused = False  # unpause the pomodomo app
-            self.after(1000, self._pomodomo_countdown_loop)  # restart loop
+            self._tick_deadline = \
+                time.monotonic() + self._timers[self._phase].seconds_left
+            # restart loop
+            self._loop_id = self.after(1000, self._pomodomo_countdown_loop)
 
     def reset_pomodomo_session(self) -> None:
         """Stops countdown of the work and break timers, and resets the
@@ -173,6 +196,7 @@ class PomodomoApp(tk.Tk):
         assert self.started
         self.started = False
         self.paused = False
+        self._cancel_countdown_loop()
         self.reset_button.disable_button()
 
         self.work_time_input.enable_input()
@@ -182,31 +206,56 @@ class PomodomoApp(tk.Tk):
         self.work_timer.reset_time_left()
         self.break_timer.reset_time_left()
 
+    def _cancel_countdown_loop(self) -> None:
+        """Cancel the next scheduled call of the countdown loop, if there is
+        one.
+        """
+        if self._loop_id is not None:
+            self.after_cancel(self._loop_id)
+            self._loop_id = None
+
     def _pomodomo_countdown_loop(self) -> None:
         """Starts counting down work time and break time, continuing this
         countdown loop until the user hits the stop button.
 
+        Time left is computed from self._tick_deadline rather than by
+        subtracting a second on every call, so the countdown doesn't drift
+        when Tkinter runs the loop late.
+
         Countdown stops when user pauses the timer, or stops it entirely.
         """
         if self.started and not self.paused:
-
-            # Time left on work_timer, so count down on that timer
-            if self.work_timer.get_time_left() != '0:00:00':
-                self.work_timer.countdown()
-
-            # Time left on _break_timer, so count down on that timer
-            elif self.break_timer.get_time_left() != '0:00:00':
-                self.break_timer.countdown()
-
-            # work_timer and _break_timer have both hit zero, so reset them
-            # for another Pomodoro work cycle
-            else:
-                self.work_timer.reset_time_left()
-                self.break_timer.reset_time_left()
-
-            # Let the method recursively call itself, to keep counting down on
-            # the timers
-            self.after(1000, self._pomodomo_countdown_loop)
+            now = time.monotonic()
+
+            # Catch up on every work/break period that ended since the last
+            # call in one go, e.g. when Tkinter couldn't run the loop while
+            # the computer was asleep, instead of one period per call
+            while self._tick_deadline <= now:
+
+                # Work time is up, so start counting down break time from
+                # when work time ended
+                if self._phase == _WORK_PHASE:
+                    self.work_timer.set_time_left(0)
+                    self._phase = _BREAK_PHASE
+                    self._tick_deadline += self.break_timer.seconds_left
+
+                # work_timer and break_timer have both hit zero, so reset
+                # them for another Pomodoro work cycle
+                else:
+                    self.work_timer.reset_time_left()
+                    self.break_timer.reset_time_left()
+                    self._phase = _WORK_PHASE
+                    self._tick_deadline += self.work_timer.seconds_left
+
+            # Only the label of the timer counting down is updated, and only
+            # if its displayed second actually changed
+            remaining = self._tick_deadline - now
+            self._timers[self._phase].set_time_left(math.ceil(remaining))
+
+            # Let the method recursively call itself just after the displayed
+            # second next changes, keeping the loop in phase with the clock
+            delay = int((remaining - math.floor(remaining)) * 1000) + 1
+            self._loop_id = self.after(delay, self._pomodomo_countdown_loop)
 
         else:  # App was paused or reset, so stop the timer countdown loop
             return
@@ -15,31 +15,47 @@ break times for the Pomo-do-mo application."""
 # Imports
 from __future__ import annotations
 
-import datetime
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import Label
 
+from validation import _parse_minutes
 
-def _is_valid_time(s: str) -> bool:
-    """Returns whether a user-inputted time is a non-negative and non-zero
-    integer or float.
-
-    >>> _is_valid_time('ooooo')
-    False
-    >>> _is_valid_time('90')
-    True
-    >>> _is_valid_time('0.5')
-    False
-    >>> _is_valid_time('0')
-    True
-    >>> _is_valid_time('-23.4')
-    False
+
+def _format_time(seconds: int) -> str:
+    """Returns a whole number of seconds formatted as H:MM:SS, matching how
+    datetime.timedelta is displayed for times under a day.
+
+    >>> _format_time(1500)
+    '0:25:00'
+    >>> _format_time(3661)
+    '1:01:01'
+    >>> _format_time(0)
+    '0:00:00'
+    """
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    return f'{hours}:{minutes:02d}:{secs:02d}'
+
+
+# Label text for every time up to three hours, indexed by seconds, so that
+# timers don't have to format a new string every second they count down
+_TIME_STRINGS = tuple(_format_time(s) for s in range(3 * 60 * 60 + 1))
+
+
+def _time_text(seconds: int) -> str:
+    """Returns the label text for a time in seconds, looking it up in
+    _TIME_STRINGS if possible and only formatting longer times from scratch.
+
+    >>> _time_text(1500)
+    '0:25:00'
+    >>> _time_text(36000)
+    '10:00:00'
     """
-    try:
-        return s.isdigit() and int(s) >= 0
+    if 0 <= seconds < len(_TIME_STRINGS):
+        return _TIME_STRINGS[seconds]
 
-    except ValueError:
-        return False  # s wasn't an int or a float
+    return _format_time(seconds)
 
 
 class _Timer(Label):
@@ -47,48 +63,69 @@ class _Timer(Label):
     and break time timer widgets.
 
     === Private attributes ===
-    _time_set: A datetime.timedelta object indicating the work/break time set
-    by the user
+    _time_set: The work/break time set by the user, in seconds
 
-    _time_left: A datetime.timedelta object indicating how much work/break time
-    is left in a given Pomodoro cycle.
+    _time_left: How much work/break time is left in a given Pomodoro cycle,
+    in seconds.
 
-    === Representational invariants ===
-    - _time_set is a valid, non-zero time in datetime.timedelta
-    - _time_left is a valid, non-zero time in datetime.timedelta
-    - datetime.timedelta(seconds = 0) <= _work_time_left <= _work_time
-    """
-    _time_set: datetime.timedelta
-    _time_left: datetime.timedelta
+    _time_set_text: The label text for _time_set.
 
-    def __init__(self, root: tk.Tk) -> None:
-        # Treat _WorkTimer as a normal Label object, setting font to size 48
-        # Arial, with black font color and white background.
-        Label.__init__(self, root, font=('Arial', 48), fg='black',
-                       bg='white')
+    _time_var: The Tkinter variable holding the label's displayed text.
 
-        # Initialize _time_set to 0 mins, and set _time_left to be the zero mins
-        self._time_set = datetime.timedelta(minutes=0)
+    _last_text: The text _time_var was last set to.
+
+    === Representational invariants ===
+    - _time_set >= 0
+    - 0 <= _time_left <= _time_set
+    """
+    # Label instances still have a __dict__ for Tkinter's own attributes, but
+    # slots make the timer's attributes fixed-offset lookups
+    __slots__ = ('_time_set', '_time_left', '_time_set_text', '_time_var',
+                 '_last_text')
+
+    _time_set: int
+    _time_left: int
+    _time_set_text: str
+    _time_var: tk.StringVar
+    _last_text: str
+
+    def __init__(self, root: tk.Tk, default_minutes: int,
+                 font: tkfont.Font) -> None:
+        # Treat _WorkTimer as a normal Label object, using the given (shared)
+        # font, with black font color. The label text is bound to _time_var,
+        # so it updates whenever _time_var is set.
+        self._time_var = tk.StringVar(master=root)
+        Label.__init__(self, root, textvariable=self._time_var,
+                       font=font, fg='black')
+
+        # Initialize _time_set to the default work/break time, and set
+        # _time_left to be that same time
+        self._time_set = default_minutes * 60
         self._time_left = self._time_set
+        self._time_set_text = _time_text(self._time_set)
 
         # Finally, set the label text of _Timer to _time_left
-        self.config(text=str(self._time_left))
+        self._last_text = ''
+        self._update_text(self._time_set_text)
 
-    def get_set_time(self) -> str:
-        """Returns the string of self._time_set.
+    @property
+    def seconds_left(self) -> int:
+        """The work/break time left, as a whole number of seconds.
         """
-        return str(self._time_set)
+        return self._time_left
 
-    def get_time_left(self) -> str:
-        """Returns the string of self._time_left.
+    def set_time_left(self, seconds: int) -> None:
+        """Set _time_left to the given number of seconds, only updating the
+        on-screen label text if the displayed time actually changed.
         """
-        return str(self._time_left)
+        self._time_left = seconds
+        self._update_text(_time_text(seconds))
 
     def reset_time_left(self) -> None:
         """Set _time_left back to _time_set.
         """
         self._time_left = self._time_set
-        self.config(text=str(self._time_set))
+        self._update_text(self._time_set_text)
 
     def set_time(self, input_time: str) -> bool:
         """Takes user-inputted time from the work/break time entry box
@@ -101,36 +138,30 @@ class _Timer(Label):
         # Take inputted work time from an entry widget, set label to that
         # amount of time, and set _time_set and _time_left to that time
 
-        # check if user-inputted time is a valid number
-        if not _is_valid_time(input_time):
+        # check if user-inputted time is a valid number of minutes
+        minutes = _parse_minutes(input_time)
+        if minutes is None:
             return False
 
-        # convert user-inputted time to minutes
-        minutes = int(float(input_time))
-
-        # if user-inputted time (in minutes) >= 60, convert to hours and get
-        # overflowing minutes from the hour
-        hours = 0  # Initialize hours as zero
-        if minutes >= 60:
-            hours = minutes // 60  # Get hours from minutes if >= 60 mins
-            minutes = minutes % 60  # Get overflowing minutes from hour
-
-        new_work_time = datetime.timedelta(hours=hours, minutes=minutes)
+        # convert user-inputted time from minutes to seconds
+        new_work_time = minutes * 60
 
-        # Update _work_time and _work_time_left to the new user-inputted work
-        # time, and change text of the _WorkTime object to reflect the new
+        # Update _time_set and _time_left to the new user-inputted work
+        # time, and change text of the _Timer object to reflect the new
         # work time
         self._time_set = new_work_time
         self._time_left = new_work_time
-        self.config(text=str(new_work_time))
+        self._time_set_text = _time_text(new_work_time)
+        self._update_text(self._time_set_text)
 
         # Finally, return True to indicate input time was valid and _WorkTimer
         # successfully updated
         return True
 
-    def countdown(self) -> None:
-        """Subtracts one second from _time_left, and updates the on-screen
-        label text of the _WorkTime object to reflect the new _time_left.
+    def _update_text(self, new_text: str) -> None:
+        """Set the on-screen label text to new_text, skipping the Tk
+        variable write if the label already shows that text.
         """
-        self._time_left -= datetime.timedelta(seconds=1)
-        self.config(text=str(self._time_left))
+        if new_text != self._last_text:
+            self._last_text = new_text
+            self._time_var.set(new_text)
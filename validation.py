@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# version = 0.0
+# ---------------------------------------------------------------------------
+
+"""This module provides validation of the work and break times users enter
+in the Pomo-do-mo application."""
+
+# ---------------------------------------------------------------------------
+
+# Imports
+from __future__ import annotations
+
+import re
+from typing import Optional
+
+# A positive whole number of minutes, without leading zeros. Times are capped
+# at six digits so they stay well within what the countdown clock can handle.
+_MINUTES_RE = re.compile(r'[1-9][0-9]{0,5}')
+
+
+def _parse_minutes(s: str) -> Optional[int]:
+    """Returns a user-inputted time as a whole number of minutes, or None if
+    it isn't a positive integer.
+
+    >>> _parse_minutes('90')
+    90
+    >>> _parse_minutes(' 05 ')
+    5
+    >>> _parse_minutes('ooooo') is None
+    True
+    >>> _parse_minutes('29.20023') is None
+    True
+    >>> _parse_minutes('0') is None
+    True
+    >>> _parse_minutes('-23.4') is None
+    True
+    >>> _parse_minutes('1' * 400) is None
+    True
+    >>> _parse_minutes('0' * 5000 + '1')
+    1
+    """
+    # Leading zeros are stripped before matching, so they can't be used to
+    # sneak an arbitrarily long string past the digit cap
+    s = s.strip().lstrip('0')
+    if _MINUTES_RE.fullmatch(s) is None:
+        return None  # s wasn't a positive whole number
+
+    return int(s)